@@ -1,79 +1,71 @@
 #!/usr/bin/env python3
 """
 Usage:
-  $0 CONFIG_FILE
+  $0 CONFIG_FILE [CONFIG_FILE ...]
 
 This script generates an SBATCH script for an ichorCNA workflow using a simple YAML configuration.
+Several configuration files are processed in parallel worker processes.
 
 Use -h or --help for additional details.
 """
 
+import os
 import sys
+import argparse
+import json
+import logging
 import yaml
-import typer
+import pickle
+import hashlib
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from jinja2 import Template
-from loguru import logger
-
-app = typer.Typer(
-    help="Generate an SBATCH script for an ichorCNA workflow using a simple YAML configuration.\n\nUsage:\n  $0 CONFIG_FILE"
-)
-
-# SBATCH template with essential parameters
-SBATCH_TEMPLATE = Template(
-r"""#!/bin/bash
-#SBATCH --job-name={{ sbatch.job_name }}
-#SBATCH --partition={{ sbatch.partition }}
-{% if sbatch.account %}#SBATCH --account={{ sbatch.account }}{% endif %}
-#SBATCH --array=0-{{ total_files - 1 }}%{{ sbatch.max_concurrent }}
-#SBATCH --time={{ sbatch.time }}
-#SBATCH --nodes={{ sbatch.nodes }}
-#SBATCH --ntasks-per-node={{ sbatch.ntasks_per_node }}
-#SBATCH --cpus-per-task={{ sbatch.cpus_per_task }}
-#SBATCH --mem={{ sbatch.mem }}
-#SBATCH --output={{ sbatch.output }}
-#SBATCH --error={{ sbatch.error }}
-#SBATCH --mail-user={{ sbatch.mail_user }}
-#SBATCH --mail-type={{ sbatch.mail_type }}
+from jinja2 import DictLoader, Environment, FileSystemBytecodeCache
+
+logger = logging.getLogger("ichorCNA_workflow")
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed configurations are pickled here, one file per config path (an empty XDG_CACHE_HOME counts as unset)
+CONFIG_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "ichorCNA_workflow"
+
+# ichorCNA flags passed to Rscript as R logicals ("TRUE"/"FALSE")
+R_LOGICAL_PARAMETERS = ("includeHOMD", "estimateNormal", "estimatePloidy", "estimateScPrevalence", "normalizeMaleX")
+
+# SBATCH template with essential parameters (header and exported environment)
+SBATCH_TEMPLATE_SRC = r"""#!/bin/bash
+#SBATCH --job-name={{ JOB_NAME }}
+#SBATCH --partition={{ PARTITION }}
+{% if ACCOUNT %}#SBATCH --account={{ ACCOUNT }}{% endif %}
+#SBATCH --array=0-{{ LAST_TASK_ID }}%{{ MAX_CONCURRENT }}
+#SBATCH --time={{ TIME }}
+#SBATCH --nodes={{ NODES }}
+#SBATCH --ntasks-per-node={{ NTASKS_PER_NODE }}
+#SBATCH --cpus-per-task={{ CPUS_PER_TASK }}
+#SBATCH --mem={{ MEM }}
+#SBATCH --output={{ OUTPUT }}
+#SBATCH --error={{ ERROR }}
+#SBATCH --mail-user={{ MAIL_USER }}
+#SBATCH --mail-type={{ MAIL_TYPE }}
 #SBATCH --signal=TERM@120
 
 set -eo pipefail
 umask 077
 
-export SAMBAMBA_CMD="{{ workflow.sambamba }}"
-export READCOUNTER_CMD="{{ workflow.readCounter }}"
-export RSCRIPT_CMD="{{ workflow.Rscript }}"
-export ICHOR_SCRIPT="{{ workflow.ichorCNA_script }}"
-export BIN_SIZE="{{ workflow.bin_size }}"
-export READCOUNTER_CHRS="{{ workflow.readcounter_chrs }}"
-export READCOUNTER_QUALITY="{{ workflow.readcounter_quality }}"
-export MY_IN_DIR="{{ workflow.my_in_dir }}"
-export MY_OUT_DIR="{{ workflow.my_out_dir }}"
-export BASE_TMP_DIR="{{ workflow.my_tmp_dir }}"
-export LIST_FILE="{{ list_file }}"
-
-export GC_FILE="{{ ichorCNA.paths.gc_file }}"
-export MAP_FILE="{{ ichorCNA.paths.map_file }}"
-export CENT_FILE="{{ ichorCNA.paths.cent_file }}"
-export PON_FILE="{{ ichorCNA.paths.PON_file }}"
-export PLOIDY="{{ ichorCNA.parameters.ploidy }}"
-export NORMAL="{{ ichorCNA.parameters.normal }}"
-export MAX_CN="{{ ichorCNA.parameters.maxCN }}"
-export INCLUDE_HOMD="{{ 'TRUE' if ichorCNA.parameters.includeHOMD else 'FALSE' }}"
-export CHRS="{{ ichorCNA.parameters.chrs }}"
-export CHR_TRAIN="{{ ichorCNA.parameters.chrTrain }}"
-export CHR_NORMALIZE="{{ ichorCNA.parameters.chrNormalize }}"
-export ESTIMATE_NORMAL="{{ 'TRUE' if ichorCNA.parameters.estimateNormal else 'FALSE' }}"
-export ESTIMATE_PLOIDY="{{ 'TRUE' if ichorCNA.parameters.estimatePloidy else 'FALSE' }}"
-export ESTIMATE_SC_PREVALENCE="{{ 'TRUE' if ichorCNA.parameters.estimateScPrevalence else 'FALSE' }}"
-export SC_STATES="{{ ichorCNA.parameters.scStates }}"
-export TXN_E="{{ ichorCNA.parameters.txnE }}"
-export TXN_STRENGTH="{{ ichorCNA.parameters.txnStrength }}"
-export GENOME_STYLE="{{ ichorCNA.parameters.genomeStyle }}"
-export GENOME_BUILD="{{ ichorCNA.parameters.genomeBuild }}"
-export PLOT_TYPE="{{ ichorCNA.parameters.plotFileType }}"
-
-process_sample() {
+# Exported environment, sourced as one here-doc and auto-exported by "set -a"
+set -a
+source /dev/stdin <<'EOF'
+{% for name, value in EXPORTS.items() %}{{ name }}="{{ value }}"
+{% endfor %}EOF
+set +a
+
+"""
+
+# Static remainder of the SBATCH script; it has no substitutions, so it is written verbatim
+SBATCH_SCRIPT_BODY = r"""process_sample() {
     local input_bam="$1"
     local sample_id="$2"
     local tmp_dir="$3"
@@ -115,7 +107,7 @@ process_sample() {
 declare -a BAM_FILES
 mapfile -t BAM_FILES < <(grep -v '^#' ${LIST_FILE})
 main() {
-    SAMPLE_ID=$(basename "${BAM_FILES[$SLURM_ARRAY_TASK_ID]}" .bam)
+    IFS=$'\t' read -r BAM_FILE SAMPLE_ID <<< "${BAM_FILES[$SLURM_ARRAY_TASK_ID]}"
     SAMPLE_TMP_BASE="${BASE_TMP_DIR}/${SAMPLE_ID}-${SLURM_JOB_ID}"
     mkdir -p "${SAMPLE_TMP_BASE}" "${MY_OUT_DIR}/${SAMPLE_ID}" || exit 1
     TMP_DIR=$(mktemp -d -p "${SAMPLE_TMP_BASE}") || exit 1
@@ -123,85 +115,377 @@ main() {
     trap 'rm -rf "${TMP_DIR}" "${SAMPLE_TMP_BASE}"' EXIT ERR
     
     process_sample \
-        "${BAM_FILES[$SLURM_ARRAY_TASK_ID]}" \
+        "${BAM_FILE}" \
         "${SAMPLE_ID}" \
         "${TMP_DIR}"
 }
 
 main "$@"
 """
-)
+SBATCH_SCRIPT_BODY_BYTES = SBATCH_SCRIPT_BODY.encode("utf-8")
+
 
-@app.command()
-def generate(
-    config_file: Path = typer.Argument(
-        ..., exists=True, dir_okay=False, readable=True, help="Path to YAML configuration file."
+@lru_cache(maxsize=1)
+def get_sbatch_template():
+    """Compile the SBATCH template once, reusing Jinja's on-disk bytecode cache across runs."""
+    # The cache is best effort: an unusable temp directory must not fail the run
+    try:
+        bytecode_cache = FileSystemBytecodeCache()
+    except (OSError, RuntimeError) as e:
+        logger.warning(f"Jinja bytecode cache disabled: {e}")
+        bytecode_cache = None
+    env = Environment(
+        loader=DictLoader({"sbatch.j2": SBATCH_TEMPLATE_SRC}),
+        keep_trailing_newline=True,
+        bytecode_cache=bytecode_cache,
     )
-):
+    return env.get_template("sbatch.j2")
+
+
+def build_template_context(sbatch: dict, workflow: dict, ichorCNA: dict, total_files: int, list_file: Path) -> dict:
     """
-    Generate an SBATCH script for an ichorCNA workflow using a simple configuration.
+    Flatten the configuration into the single-name variables used by the SBATCH template.
+
+    EXPORTS maps each environment variable of the generated script to its value, in output order.
+    """
+    paths = ichorCNA["paths"]
+    parameters = ichorCNA["parameters"]
+    return {
+        "JOB_NAME": sbatch["job_name"],
+        "PARTITION": sbatch["partition"],
+        "ACCOUNT": sbatch.get("account"),
+        "LAST_TASK_ID": total_files - 1,
+        "MAX_CONCURRENT": sbatch["max_concurrent"],
+        "TIME": sbatch["time"],
+        "NODES": sbatch["nodes"],
+        "NTASKS_PER_NODE": sbatch["ntasks_per_node"],
+        "CPUS_PER_TASK": sbatch["cpus_per_task"],
+        "MEM": sbatch["mem"],
+        "OUTPUT": sbatch["output"],
+        "ERROR": sbatch["error"],
+        "MAIL_USER": sbatch["mail_user"],
+        "MAIL_TYPE": sbatch["mail_type"],
+        "EXPORTS": {
+            "SAMBAMBA_CMD": workflow["sambamba"],
+            "READCOUNTER_CMD": workflow["readCounter"],
+            "RSCRIPT_CMD": workflow["Rscript"],
+            "ICHOR_SCRIPT": workflow["ichorCNA_script"],
+            "BIN_SIZE": workflow["bin_size"],
+            "READCOUNTER_CHRS": workflow["readcounter_chrs"],
+            "READCOUNTER_QUALITY": workflow["readcounter_quality"],
+            "MY_IN_DIR": workflow["my_in_dir"],
+            "MY_OUT_DIR": workflow["my_out_dir"],
+            "BASE_TMP_DIR": workflow["my_tmp_dir"],
+            "LIST_FILE": os.fspath(list_file),
+            "GC_FILE": paths["gc_file"],
+            "MAP_FILE": paths["map_file"],
+            "CENT_FILE": paths["cent_file"],
+            "PON_FILE": paths["PON_file"],
+            "PLOIDY": parameters["ploidy"],
+            "NORMAL": parameters["normal"],
+            "MAX_CN": parameters["maxCN"],
+            "INCLUDE_HOMD": parameters["includeHOMD"],
+            "CHRS": parameters["chrs"],
+            "CHR_TRAIN": parameters["chrTrain"],
+            "CHR_NORMALIZE": parameters["chrNormalize"],
+            "ESTIMATE_NORMAL": parameters["estimateNormal"],
+            "ESTIMATE_PLOIDY": parameters["estimatePloidy"],
+            "ESTIMATE_SC_PREVALENCE": parameters["estimateScPrevalence"],
+            "SC_STATES": parameters["scStates"],
+            "TXN_E": parameters["txnE"],
+            "TXN_STRENGTH": parameters["txnStrength"],
+            "GENOME_STYLE": parameters["genomeStyle"],
+            "GENOME_BUILD": parameters["genomeBuild"],
+            "PLOT_TYPE": parameters["plotFileType"],
+        },
+    }
+
+
+# A file or directory modified this recently is "racily clean": on filesystems that store
+# mtimes to the second (NFS, Lustre, GPFS) a same-size config edit or a BAM added within
+# the same tick leaves mtime and size unchanged, so nothing is cached for it
+RACY_MTIME_WINDOW_NS = 2_000_000_000
+
+# Fingerprint of this generator (template and the code preparing its context and the BAM list),
+# stored in the cache stamp so any edit to the script invalidates previous outputs
+GENERATOR_SHA1 = hashlib.sha1(Path(__file__).read_bytes()).hexdigest()
+
+
+@contextmanager
+def open_atomic(path: Path):
+    """Open a temporary file for binary writing and rename it over path once the block succeeds."""
+    # The PID keeps concurrent writers (e.g. the same config twice in generate_many) apart
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with tmp_path.open("wb") as f:
+            yield f
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def write_atomic(path: Path, data: bytes):
+    """Write data via a temporary file and rename it, so readers never see a partial file."""
+    with open_atomic(path) as f:
+        f.write(data)
+
+
+def is_racy(mtime_ns: int, read_time_ns: int = None) -> bool:
+    """Return True if mtime_ns is too close to when the file was read (default: now) to prove it unchanged."""
+    if read_time_ns is None:
+        read_time_ns = time.time_ns()
+    return read_time_ns - mtime_ns < RACY_MTIME_WINDOW_NS
+
+
+def file_sha1(path) -> str:
+    """Return the SHA-1 of a file's contents."""
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def config_stamp(config_file: Path) -> dict:
+    """Identify a configuration file and generator version without parsing the YAML."""
+    st = config_file.stat()
+    return {
+        "config_mtime_ns": st.st_mtime_ns,
+        "config_size": st.st_size,
+        "generator_sha1": GENERATOR_SHA1,
+    }
+
+
+def load_cached_stamp(cache_path: Path, stamp: dict, sbatch_path: Path):
+    """
+    Return the stamp saved by a previous run if its outputs are still current, otherwise None.
+
+    Outputs are current when the config and generator are unchanged, the input directory
+    has not gained or lost entries (its mtime is unchanged) and both generated files still
+    hold what this config wrote (their content hashes match), so a list overwritten by
+    another config sharing my_out_dir or a hand-edited script is regenerated.
+    Deleting the target of a symlinked BAM does not change the directory mtime, so it does
+    not invalidate the stamp.
+    """
+    # A corrupt or hand-edited stamp counts as a miss, never as an error
+    try:
+        cached = json.loads(cache_path.read_text())
+        if not isinstance(cached, dict):
+            return None
+        if any(cached.get(key) != value for key, value in stamp.items()):
+            return None
+        if os.stat(cached["in_dir"]).st_mtime_ns != cached["in_dir_mtime_ns"]:
+            return None
+        log_dirs = cached["log_dirs"]
+        if not (isinstance(log_dirs, list) and all(isinstance(log_dir, str) for log_dir in log_dirs)):
+            return None
+        if file_sha1(sbatch_path) != cached["sbatch_sha1"]:
+            return None
+        if file_sha1(cached["list_file"]) != cached["list_sha1"]:
+            return None
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    return cached
+
+
+def parse_config(config_file: Path) -> dict:
+    """
+    Parse the YAML configuration, reusing a pickled copy if the file has not changed.
+
+    The cache file is keyed by the resolved path only and records the mtime and size it was
+    parsed at, so editing a config replaces its entry instead of adding a new one.
+    """
+    st = config_file.stat()
+    signature = (st.st_mtime_ns, st.st_size)
+    key = hashlib.blake2b(str(config_file.resolve()).encode()).hexdigest()
+    cache_file = CONFIG_CACHE_DIR / f"{key}.pkl"
+    # A missing, corrupt or foreign pickle counts as a miss; unpickling can raise almost anything
+    try:
+        cached_signature, cached_config = pickle.loads(cache_file.read_bytes())
+        if cached_signature == signature:
+            return cached_config
+    except Exception:
+        pass
+
+    with config_file.open("rb") as f:
+        config = yaml.load(f, Loader=YAML_LOADER)
+
+    # Like git's "racily clean" check: a later same-size edit in this tick would go unnoticed
+    if is_racy(st.st_mtime_ns):
+        return config
+
+    # The cache is best effort: an unwritable cache directory must not fail the run
+    try:
+        CONFIG_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        write_atomic(cache_file, pickle.dumps((signature, config), protocol=5))
+    except OSError as e:
+        logger.warning(f"Could not cache parsed config in {CONFIG_CACHE_DIR}: {e}")
+    return config
+
+
+def load_config(config_file: Path) -> dict:
+    """Load the YAML configuration and normalize the values the template relies on."""
+    config = parse_config(config_file)
+    workflow = config["workflow"]
+
+    # Remove trailing slash from directory paths if present
+    workflow["my_in_dir"] = workflow["my_in_dir"].rstrip("/")
+    workflow["my_out_dir"] = workflow["my_out_dir"].rstrip("/")
+    workflow["my_tmp_dir"] = workflow["my_tmp_dir"].rstrip("/")
+
+    # Convert boolean flags to R logicals so the template only substitutes values
+    parameters = config["ichorCNA"]["parameters"]
+    for key in R_LOGICAL_PARAMETERS:
+        parameters[key] = "TRUE" if parameters.get(key) else "FALSE"
+
+    return config
+
+
+def write_sbatch(config_file: Path) -> Path:
+    """
+    Write the BAM list and SBATCH script for one configuration and return the script path.
 
     The YAML file should contain keys: 'sbatch', 'workflow', and 'ichorCNA'.
     """
-    logger.remove()
-    logger.add(
-        sys.stderr,
-        format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <level>{message}</level>",
-        level="INFO"
+    # Reuse the previous output if neither the config nor the input directory changed
+    sbatch_path = config_file.with_suffix(".sl")
+    cache_path = config_file.with_suffix(".cache.json")
+    stamp = config_stamp(config_file)
+    cached = load_cached_stamp(cache_path, stamp, sbatch_path)
+    if cached is not None:
+        for log_dir in cached["log_dirs"]:
+            Path(log_dir).mkdir(parents=True, exist_ok=True)
+        logger.info(f"SBATCH script is up to date: {sbatch_path}")
+        return sbatch_path
+
+    config = load_config(config_file)
+    sbatch = config["sbatch"]
+    workflow = config["workflow"]
+    ichorCNA = config["ichorCNA"]
+
+    # Enumerate BAM files from my_in_dir, stopping as soon as max_queue is exceeded
+    # (the directory mtime is taken first so entries added mid-scan invalidate the cache,
+    # provided the filesystem timestamp resolution can tell them apart; see below)
+    max_queue = sbatch["max_queue"]
+    in_dir_mtime_ns = os.stat(workflow["my_in_dir"]).st_mtime_ns
+    # Filter on the entry name first: is_file() may need a stat() for symlinked BAMs,
+    # which are followed so linked inputs are picked up as well
+    bam_files = []
+    append = bam_files.append
+    with os.scandir(workflow["my_in_dir"]) as entries:
+        for entry in entries:
+            if entry.name.endswith(".bam") and entry.is_file():
+                append(entry.path)
+                if len(bam_files) > max_queue:
+                    raise ValueError(f"Number of BAM files in {workflow['my_in_dir']} exceeds max_queue of {max_queue}.")
+    if not bam_files:
+        raise FileNotFoundError(f"No BAM files found in {workflow['my_in_dir']}.")
+    # Plain string ordering is enough to keep SLURM array indices deterministic
+    bam_files.sort()
+    scan_time_ns = time.time_ns()
+
+    # Create output directory for results
+    Path(workflow["my_out_dir"]).mkdir(parents=True, exist_ok=True)
+
+    # Create log folders based on YAML log paths (e.g., "./log")
+    log_dirs = [str(Path(log_path).parent) for log_path in (sbatch["output"], sbatch["error"])]
+    for log_dir in log_dirs:
+        Path(log_dir).mkdir(parents=True, exist_ok=True)
+
+    # Write BAM file list as "<bam path>\t<sample id>" so array tasks need no basename call
+    yaml_stem = config_file.stem
+    list_file = Path(workflow["my_out_dir"]) / f"{yaml_stem}.lst"
+    with list_file.open("w", buffering=1 << 20) as f:
+        f.writelines(f"{bam}\t{os.path.basename(bam)[:-len('.bam')]}\n" for bam in bam_files)
+    logger.info(f"Wrote {len(bam_files)} entries to {list_file}.")
+
+    context = build_template_context(sbatch, workflow, ichorCNA, len(bam_files), list_file)
+    # Stream the rendered chunks straight to disk instead of building the whole script in memory,
+    # then append the pre-encoded static body
+    with open_atomic(sbatch_path) as f:
+        get_sbatch_template().stream(context).dump(f, encoding="utf-8")
+        f.write(SBATCH_SCRIPT_BODY_BYTES)
+    logger.info(f"Generated SBATCH script: {sbatch_path}")
+
+    # Like git's "racily clean" check: a recent mtime cannot prove the scan saw every entry,
+    # nor that a later same-size edit of the config would be noticed
+    if is_racy(in_dir_mtime_ns, scan_time_ns) or is_racy(stamp["config_mtime_ns"]):
+        cache_path.unlink(missing_ok=True)
+        return sbatch_path
+
+    stamp.update(
+        in_dir=workflow["my_in_dir"],
+        in_dir_mtime_ns=in_dir_mtime_ns,
+        list_file=str(list_file),
+        list_sha1=file_sha1(list_file),
+        sbatch_sha1=file_sha1(sbatch_path),
+        log_dirs=log_dirs,
     )
-    
-    try:
-        # Load configuration as a simple dictionary
-        config = yaml.safe_load(config_file.read_text())
-        sbatch = config["sbatch"]
-        workflow = config["workflow"]
-        ichorCNA = config["ichorCNA"]
-        
-        # Remove trailing slash from directory paths if present
-        workflow["my_in_dir"] = workflow["my_in_dir"].rstrip("/")
-        workflow["my_out_dir"] = workflow["my_out_dir"].rstrip("/")
-        workflow["my_tmp_dir"] = workflow["my_tmp_dir"].rstrip("/")
-
-
-        # Create output directory for results
-        Path(workflow["my_out_dir"]).mkdir(parents=True, exist_ok=True)
-        
-        # Create log folders based on YAML log paths (e.g., "./log")
-        for log_path in (sbatch["output"], sbatch["error"]):
-            Path(log_path).parent.mkdir(parents=True, exist_ok=True)
-
-        # Enumerate BAM files from my_in_dir
-        bam_files = sorted(Path(workflow["my_in_dir"]).glob("*.bam"))
-        if not bam_files:
-            raise FileNotFoundError(f"No BAM files found in {workflow['my_in_dir']}.")
-        if len(bam_files) > sbatch["max_queue"]:
-            raise ValueError(f"Number of BAM files ({len(bam_files)}) exceeds max_queue of {sbatch['max_queue']}.")
-
-        # Write BAM file list
-        yaml_stem = config_file.stem
-        list_file = Path(workflow["my_out_dir"]) / f"{yaml_stem}.lst"
-        list_file.write_text("\n".join(str(bam) for bam in bam_files))
-        logger.info(f"Wrote {len(bam_files)} entries to {list_file}.")
-
-        rendered_script = SBATCH_TEMPLATE.render(
-            sbatch=sbatch,
-            workflow=workflow,
-            ichorCNA=ichorCNA,
-            total_files=len(bam_files),
-            output_dir=workflow["my_out_dir"],
-            list_file=str(list_file)
-        )
-
-        sbatch_path = config_file.with_suffix(".sl")
-        sbatch_path.write_text(rendered_script)
-        logger.success(f"Generated SBATCH script: {sbatch_path}")
+    write_atomic(cache_path, json.dumps(stamp, indent=2).encode("utf-8"))
+    return sbatch_path
+
 
+def configure_logging():
+    """Set up stderr logging for the CLI; also runs as the process pool's worker initializer."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s | %(levelname)-8s | %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+
+
+def generate_one(config_file: Path) -> bool:
+    """Generate the outputs for one configuration, logging the error instead of raising it."""
+    try:
+        write_sbatch(config_file)
+        return True
     except Exception as e:
-        logger.critical(f"Fatal error: {e}")
+        logger.critical(f"Fatal error in {config_file}: {e}")
+        return False
+
+
+def generate(config_file: Path):
+    """
+    Generate an SBATCH script for an ichorCNA workflow using a simple configuration.
+
+    The YAML file should contain keys: 'sbatch', 'workflow', and 'ichorCNA'.
+    """
+    configure_logging()
+    if not generate_one(config_file):
         sys.exit(2)
 
+
+def generate_many(config_files: list[Path]):
+    """
+    Generate SBATCH scripts for several configurations in parallel worker processes.
+
+    Each worker compiles the template once and reuses it for every configuration it handles.
+    Exits with status 2 if any configuration failed.
+    """
+    configure_logging()
+    max_workers = min(len(config_files), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=configure_logging) as executor:
+        results = list(executor.map(generate_one, config_files))
+    if not all(results):
+        sys.exit(2)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Generate an SBATCH script for an ichorCNA workflow using a simple YAML configuration."
+    )
+    parser.add_argument("config_files", type=Path, nargs="+", metavar="config_file", help="Path to YAML configuration file(s).")
+    args = parser.parse_args(argv)
+    for config_file in args.config_files:
+        if not config_file.is_file():
+            parser.error(f"File '{config_file}' does not exist or is not a file.")
+        if not os.access(config_file, os.R_OK):
+            parser.error(f"File '{config_file}' is not readable.")
+    if len(args.config_files) == 1:
+        generate(args.config_files[0])
+    else:
+        generate_many(args.config_files)
+
+
 if __name__ == "__main__":
-    app()
+    main()
   
 
 